@@ -50,6 +50,27 @@ class DeviceManagerUI:
         )
         # Store messages until the UI is built
         self.log_messages = []
+        # Coalesces bursts of log messages into one log_column update per frame
+        self._log_update_pending = False
+        self._log_update_lock = threading.Lock()
+
+        # Shared glass styling for the two outer panels (device list and log)
+        self.panel_style = dict(
+            bgcolor=self.glass_bgcolor,  # Semi-transparent background
+            blur=self.container_blur,
+            shadow=self.container_shadow,
+            border_radius=15,
+            padding=20,
+        )
+
+        # Shared glass styling for every device section card. No blur or shadow
+        # here: the cards scroll inside device_panel, which already has both
+        self.section_card_style = dict(
+            bgcolor=self.glass_bgcolor,  # Semi-transparent background
+            border_radius=10,
+            padding=15,
+            margin=ft.margin.only(bottom=15),
+        )
 
         # PowerShell path (for Windows-based operations)
         self.POWERSHELL_PATH = "C:\\Windows\\System32\\WindowsPowerShell\\v1.0\\powershell.exe"
@@ -61,25 +82,48 @@ class DeviceManagerUI:
         """Add a message to the log section."""
         # If UI is built, append immediately
         if self.log_column and hasattr(self.log_column, 'page') and self.log_column.page:
-            self.log_column.controls.append(ft.Text(text, color=color))
-            self.log_column.update()
+            with self._log_update_lock:
+                self.log_column.controls.append(ft.Text(text, color=color))
+            self.schedule_log_update()
         else:
             # Otherwise, store for later
             self.log_messages.append((text, color))
 
+    def schedule_log_update(self):
+        """Queue a log_column.update(); calls within ~16ms share a single flush."""
+        with self._log_update_lock:
+            if self._log_update_pending:
+                return
+            self._log_update_pending = True
+        threading.Timer(0.016, self._flush_log_update).start()
+
+    def _flush_log_update(self):
+        # Holding the lock keeps appends and clears out of the middle of an update
+        with self._log_update_lock:
+            self._log_update_pending = False
+            if self.log_column.page:
+                self.log_column.update()
+
     def display_stored_log_messages(self):
         """Display any messages stored before UI was built."""
         if self.log_column and hasattr(self.log_column, 'page') and self.log_column.page:
-            for text, color in self.log_messages:
-                self.log_column.controls.append(ft.Text(text, color=color))
-            self.log_messages.clear()
-            self.log_column.update()
+            with self._log_update_lock:
+                for text, color in self.log_messages:
+                    self.log_column.controls.append(ft.Text(text, color=color))
+                self.log_messages.clear()
+            self.schedule_log_update()
 
     def clear_logs(self):
         """Clear all log messages."""
         if self.log_column:
-            self.log_column.controls.clear()
+            with self._log_update_lock:
+                self.log_column.controls.clear()
             self.add_to_log("🧹 Logs cleared", self.text_color)
+            self.schedule_log_update()
+
+    def create_section_card(self, content: ft.Control, **kwargs) -> ft.Container:
+        """Wrap a device section in the shared glass card styling."""
+        return ft.Container(content=content, **self.section_card_style, **kwargs)
 
     def run_powershell_command(self, command: str) -> str:
         """Run a PowerShell command and return its output (Windows only)."""
@@ -174,7 +218,7 @@ class DeviceManagerUI:
         def enable_all_usb(e):
             self.toggle_usb("enable")
 
-        return ft.Container(
+        return self.create_section_card(
             content=ft.Column([
                 ft.Text("USB Control", size=16, weight=ft.FontWeight.BOLD, color=self.text_color),
                 ft.Row([usb_dropdown]),
@@ -187,12 +231,6 @@ class DeviceManagerUI:
                     ft.ElevatedButton("Enable All USB", on_click=enable_all_usb, bgcolor="green", color="white"),
                 ]),
             ]),
-            bgcolor=self.glass_bgcolor,  # Semi-transparent background
-            blur=self.container_blur,
-            shadow=self.container_shadow,
-            border_radius=10,
-            padding=15,
-            margin=ft.margin.only(bottom=15),
         )
 
     # ----------------------
@@ -226,7 +264,7 @@ class DeviceManagerUI:
 
     def create_camera_section(self) -> ft.Container:
         """Camera control UI."""
-        return ft.Container(
+        return self.create_section_card(
             content=ft.Column([
                 ft.Text("Camera Control", size=16, weight=ft.FontWeight.BOLD, color=self.text_color),
                 ft.Row([
@@ -244,12 +282,6 @@ class DeviceManagerUI:
                     ),
                 ]),
             ]),
-            bgcolor=self.glass_bgcolor,  # Semi-transparent background
-            blur=self.container_blur,
-            shadow=self.container_shadow,
-            border_radius=10,
-            padding=15,
-            margin=ft.margin.only(bottom=15),
         )
 
     # ----------------------
@@ -308,7 +340,7 @@ class DeviceManagerUI:
             weight=ft.FontWeight.W_500
         )
 
-        return ft.Container(
+        return self.create_section_card(
             content=ft.Column([
                 ft.Text("Microphone Control", size=16, weight=ft.FontWeight.BOLD, color=self.text_color),
                 ft.Container(height=10),
@@ -324,12 +356,6 @@ class DeviceManagerUI:
                     ft.Text("ON" if not mic_state else "OFF", color="green" if not mic_state else "red"),
                 ]),
             ]),
-            bgcolor=self.glass_bgcolor,  # Semi-transparent background
-            blur=self.container_blur,
-            shadow=self.container_shadow,
-            border_radius=10,
-            padding=15,
-            margin=ft.margin.only(bottom=15),
             width=350,
         )
 
@@ -464,7 +490,7 @@ class DeviceManagerUI:
             else:
                 self.add_to_log("⚠️ Select a valid device type.", "red")
 
-        return ft.Container(
+        return self.create_section_card(
             content=ft.Column([
                 ft.Text("Bluetooth Control", size=16, weight=ft.FontWeight.BOLD, color=self.text_color),
                 ft.Container(height=10),
@@ -487,12 +513,6 @@ class DeviceManagerUI:
                     ft.ElevatedButton("Enable by Type", on_click=enable_by_type, bgcolor="purple", color="white"),
                 ]),
             ]),
-            bgcolor=self.glass_bgcolor,  # Semi-transparent background
-            blur=self.container_blur,
-            shadow=self.container_shadow,
-            border_radius=10,
-            padding=15,
-            margin=ft.margin.only(bottom=15),
         )
 
     # ----------------------
@@ -679,7 +699,7 @@ class DeviceManagerUI:
             on_click=refresh_networks
         )
 
-        return ft.Container(
+        return self.create_section_card(
             content=ft.Column([
                 ft.Row([
                     ft.Text("Wi-Fi Control", size=16, weight=ft.FontWeight.BOLD, color=self.text_color),
@@ -716,12 +736,6 @@ class DeviceManagerUI:
                     ft.ElevatedButton("Unblock Network", on_click=unblock_ssid_click, bgcolor="purple", color="white"),
                 ]),
             ]),
-            bgcolor=self.glass_bgcolor,  # Semi-transparent background
-            blur=self.container_blur,
-            shadow=self.container_shadow,
-            border_radius=10,
-            padding=15,
-            margin=ft.margin.only(bottom=15),
         )
 
     # ----------------------
@@ -760,24 +774,16 @@ class DeviceManagerUI:
         # Device manager panel - with more transparent background
         device_panel = ft.Container(
             expand=2,
-            bgcolor=self.glass_bgcolor,  # Using the semi-transparent glass color
-            blur=self.container_blur,
-            shadow=self.container_shadow,
-            border_radius=15,
+            **self.panel_style,
             margin=ft.margin.only(left=10, right=10, top=2, bottom=10),
-            padding=20,
             content=self.create_device_panel()
         )
 
         # Log panel - with more transparent background
         log_panel = ft.Container(
             expand=1,
-            bgcolor=self.glass_bgcolor,  # Using the semi-transparent glass color
-            blur=self.container_blur,
-            shadow=self.container_shadow,
-            border_radius=15,
+            **self.panel_style,
             margin=ft.margin.only(right=10, top=2, bottom=10),
-            padding=20,
             content=ft.Column(
                 controls=[
                     ft.Row(
@@ -788,7 +794,6 @@ class DeviceManagerUI:
                                 weight=ft.FontWeight.BOLD,
                                 color=self.text_color
                             ),
-                            ft.Container(expand=True),
                             ft.IconButton(
                                 icon=ft.icons.DELETE_SWEEP,
                                 icon_color=self.text_color,
@@ -796,6 +801,7 @@ class DeviceManagerUI:
                                 on_click=lambda e: self.clear_logs(),
                             ),
                         ],
+                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
                     ),
                     ft.Container(
                         content=self.log_column,
@@ -1,6 +1,10 @@
 import flet as ft
 import os
 import sys
+import io
+import base64
+import threading
+from functools import partial, lru_cache
 from flet import Icons, BlurTileMode, Colors, BoxShadow, ShadowBlurStyle, Offset, Blur, Stack, ImageFit, ImageRepeat
 from proc_chain import create_process_chains_layout, start_proc_chain_updates
 from network_monitor import create_network_monitoring_layout
@@ -9,6 +13,41 @@ from Scheduled_processes import create_system_distribution_layout, start_realtim
 from logs_analytics import create_logs_analytics_layout
 from device_manager import DeviceManagerUI
 
+try:
+    from PIL import Image as PILImage, ImageOps
+except ImportError:  # Pillow is optional, Flet scales the original image instead
+    PILImage = None
+
+# Shared layout values for sidebar tab items
+TAB_PADDING = ft.padding.symmetric(horizontal=10, vertical=5)
+TAB_ICON_LABEL_SPACING = 5
+
+# Sidebar tabs in display order: (svg_icons key, label)
+TABS = (
+    ("process_monitor", "Process Monitor"),
+    ("network", "Network Connections"),
+    ("scheduled", "Scheduled Processes"),
+    ("process_chains", "Process Chains"),
+    ("device_manager", "Device Manager"),
+    ("system_logs", "System Logs"),
+)
+
+# Shared colors, one string object reused by every control
+WHITE = "white"
+MUTED_GREY = "#6c757d"
+NAVY = "#00008B"
+
+# Shared layout values for the top bar
+SEARCH_HINT_STYLE = ft.TextStyle(color=MUTED_GREY)
+SEARCH_FIELD_PADDING = ft.padding.only(left=10, right=10)
+SEARCH_BOX_PADDING = ft.padding.only(left=15, right=15)
+TOP_BAR_PADDING = ft.padding.only(left=5, right=20, top=0)
+AVATAR_BGCOLOR = NAVY
+
+# User shown in the top bar (there is no profile source yet)
+USER_NAME = "Mann Pandya"
+USER_INITIALS = "".join(part[0] for part in USER_NAME.split()[:2]).upper()
+
 # Path helper function for PyInstaller
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
@@ -17,9 +56,41 @@ def get_resource_path(relative_path):
         base_path = sys._MEIPASS
     except Exception:
         base_path = os.path.abspath(".")
+        # Fall back to this script's folder when not launched from inside it
+        if not os.path.exists(os.path.join(base_path, relative_path)):
+            base_path = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(base_path, relative_path)
 
+@lru_cache(maxsize=None)
+def read_base64(file_path):
+    """Read a file once per process and return it base64-encoded, or None if missing"""
+    try:
+        with open(file_path, "rb") as f:
+            return base64.b64encode(f.read()).decode()
+    except OSError:
+        return None
+
+def rasterize_image(image_path, width, height):
+    """Scale and crop an image to width x height once, returned as base64 JPEG"""
+    if PILImage is None or not os.path.exists(image_path):
+        return None
+    try:
+        with PILImage.open(image_path) as img:
+            img = ImageOps.fit(img.convert("RGB"), (width, height), PILImage.LANCZOS)
+            buffer = io.BytesIO()
+            img.save(buffer, "JPEG", quality=85)
+        return base64.b64encode(buffer.getvalue()).decode()
+    except Exception as e:
+        print(f"Error rasterizing {image_path}: {e}")
+        return None
+
 class DesktopApp:
+    # Icons used by the app chrome, resolved once when the class is defined
+    ICON_SEARCH = Icons.SEARCH
+    ICON_ARROW_DOWN = Icons.ARROW_DROP_DOWN
+    ICON_MENU = Icons.MENU
+    ICON_NOTIFICATIONS = Icons.NOTIFICATIONS_OUTLINED
+
     def __init__(self):
         # Initialize common properties
         self.window_width = 1280
@@ -31,9 +102,37 @@ class DesktopApp:
         self.accent_color = "#00ffff"
         self.text_color = "#ffffff"
         self.selected_tab_index = 0
+        self._prev_tab_index = 0
         self.sidebar_expanded = False
         self.sidebar_width = 50
         self.sidebar_expanded_width = 150
+        # Current width of the sidebar and its tabs, updated only by toggle_sidebar
+        self._tab_width = self.sidebar_width
+        # Tab content is built on first visit and reused afterwards
+        self._tab_content_cache = {}
+        self._tab_build_lock = threading.Lock()
+        # Background updaters of each tab, started once after the tab is shown
+        self._tab_starters = {}
+        self._tab_started = set()
+        self._tab_start_lock = threading.Lock()
+        # Set while a tab is on screen, its background polling pauses otherwise
+        self._tab_visible = {}
+        # Builders for each tab index, only called when a tab is first shown
+        self._tab_factories = {
+            0: self.build_process_monitor_tab,
+            1: self.build_network_tab,
+            2: self.build_scheduled_tab,
+            3: self.build_process_chains_tab,
+            4: self.build_device_manager_tab,
+            5: self.build_system_logs_tab,
+        }
+        self._tab_tooltips = {}
+        # Shared style objects reused by every tab item
+        self._tooltip_text_style = ft.TextStyle(color=WHITE)
+        self._accent_border = ft.border.all(1, self.accent_color)
+        # Coalesces bursts of page updates into one per frame
+        self._update_pending = False
+        self._update_lock = threading.Lock()
         
         # Glass effect properties
         self.glass_bgcolor = "#20f4f4f4"
@@ -45,95 +144,166 @@ class DesktopApp:
             offset=Offset(2, 2),
             blur_style=ShadowBlurStyle.OUTER
         )
+        # Blur-less shadow for large static surfaces that never move
+        self.container_shadow_fast = BoxShadow(
+            spread_radius=1,
+            blur_radius=0,
+            color=Colors.BLACK54,
+            offset=Offset(2, 2),
+            blur_style=ShadowBlurStyle.OUTER
+        )
+        # One shared animation descriptor for the sidebar and its tabs
+        self.ease_animation = ft.animation.Animation(300, ft.AnimationCurve.EASE_OUT)
         
         # Path setup - use get_resource_path for PyInstaller compatibility
         self.base_path = get_resource_path("assets")
-        self.bg_image_path = os.path.join(self.base_path, "Background.png")
+        # Every asset path is joined, normalized and interned once here
+        self._assets = {
+            name: sys.intern(os.path.normpath(os.path.join(self.base_path, name)))
+            for name in (
+                "Background.png", "logo.png",
+                "Process.svg", "Network.svg", "scheduled.svg",
+                "Chaining.svg", "device_manager.svg", "systemlog.svg",
+            )
+        }
+        self.bg_image_path = self._assets["Background.png"]
+        # Pre-rasterize the wallpaper at window size so it is decoded and scaled once
+        self._bg_size = (self.window_width, self.window_height)
+        self._bg_b64 = rasterize_image(self.bg_image_path, *self._bg_size)
+        # Same decoration object for every main() call, replaced only on resize
+        self._background = self.create_background_image()
         
         self.svg_icons = {
-            "process_monitor": os.path.join(self.base_path, "Process.svg"),
-            "network": os.path.join(self.base_path, "Network.svg"),
-            "scheduled": os.path.join(self.base_path, "scheduled.svg"),
-            "process_chains": os.path.join(self.base_path, "Chaining.svg"),
-            "device_manager": os.path.join(self.base_path, "device_manager.svg"),
-            "system_logs": os.path.join(self.base_path, "systemlog.svg"),
+            "process_monitor": self._assets["Process.svg"],
+            "network": self._assets["Network.svg"],
+            "scheduled": self._assets["scheduled.svg"],
+            "process_chains": self._assets["Chaining.svg"],
+            "device_manager": self._assets["device_manager.svg"],
+            "system_logs": self._assets["systemlog.svg"],
+        }
+        # Preload icon bytes so tab items are served from memory, not disk
+        self.svg_base64 = {
+            icon_path: read_base64(icon_path)
+            for icon_path in self.svg_icons.values()
         }
+        self.logo_path = self._assets["logo.png"]
+        self._logo_b64 = read_base64(self.logo_path)
+        self._logo_img = None
+        # Top bar user controls, built once so later changes can patch them in place
+        self._avatar_ctrl = ft.CircleAvatar(
+            key="avatar",
+            content=ft.Text(USER_INITIALS),
+            bgcolor=AVATAR_BGCOLOR,
+            radius=16,
+        )
+        self._name_ctrl = ft.Text(USER_NAME, key="user-name", color=WHITE, size=14)
+        # Static top bar icons, per app because a control can only have one parent
+        self._search_icon = ft.Icon(self.ICON_SEARCH, color=MUTED_GREY, size=20)
+        self._arrow_icon = ft.Icon(self.ICON_ARROW_DOWN, color=WHITE)
+        # Avatar, name and arrow as one unit; a profile menu would hook on_click here
+        self._profile_group = ft.Container(
+            content=ft.Row([self._avatar_ctrl, self._name_ctrl, self._arrow_icon], spacing=5),
+        )
+
+        # Root of the page tree, built on the first main() call
+        self.root_container = None
+
+        # Static chrome is built once and reused by every main() call
+        self.left_sidebar = self.create_sidebar()
+        self._top_bar = self.create_top_bar()
 
-    def get_tab_content(self):
-        """Return the appropriate content based on the selected tab"""
+    def build_process_monitor_tab(self):
+        visible = self._tab_visible[0] = threading.Event()
+        if self.selected_tab_index == 0:
+            visible.set()
+        layout, init_proc = create_process_monitoring_layout(
+            glass_bgcolor=self.glass_bgcolor,
+            container_blur=self.container_blur,
+            container_shadow=self.container_shadow_fast,
+            visible_event=visible
+        )
+        self._tab_starters[0] = partial(init_proc, self.page)
+        return layout
+
+    def build_network_tab(self):
+        layout, init_network = create_network_monitoring_layout(
+            glass_bgcolor=self.glass_bgcolor,
+            container_blur=self.container_blur,
+            container_shadow=self.container_shadow_fast
+        )
+        self._tab_starters[1] = partial(init_network, self.page)
+        return layout
+
+    def build_scheduled_tab(self):
+        layout, dashboard = create_system_distribution_layout(
+            glass_bgcolor=self.glass_bgcolor,
+            container_blur=self.container_blur,
+            container_shadow=self.container_shadow_fast
+        )
+        self._tab_starters[2] = partial(start_realtime_updates, self.page, dashboard)
+        return layout
+
+    def build_process_chains_tab(self):
+        layout, dashboard = create_process_chains_layout(
+            glass_bgcolor=self.glass_bgcolor,
+            container_blur=self.container_blur,
+            container_shadow=self.container_shadow_fast
+        )
+        self._tab_starters[3] = partial(start_proc_chain_updates, self.page, dashboard)
+        return layout
+
+    def build_device_manager_tab(self):
+        # Use DeviceManagerUI from the external module
+        device_manager_ui = DeviceManagerUI(
+            base_path=self.base_path,
+            glass_bgcolor=self.glass_bgcolor,
+            container_blur=self.container_blur,
+            container_shadow=self.container_shadow_fast,
+            accent_color=self.accent_color,
+            background_color=self.dark_bg,
+            text_color=self.text_color
+        )
+        return device_manager_ui.build()  # Use the container directly
+
+    def build_system_logs_tab(self):
+        layout, init_logs = create_logs_analytics_layout(
+            base_path=self.base_path,
+            glass_bgcolor=self.glass_bgcolor,
+            container_blur=self.container_blur,
+            container_shadow=self.container_shadow_fast,
+            accent_color=self.accent_color,
+            background_color=self.dark_bg,
+            card_color=self.dark_card,
+            text_color="#FFFFFF"
+        )
+        self._tab_starters[5] = partial(init_logs, self.page)
+        return layout
+
+    def build_coming_soon_tab(self):
+        return ft.Container(
+            content=ft.Text("Coming Soon...", size=20, color=WHITE),
+            alignment=ft.alignment.center,
+            expand=True
+        )
+
+    def get_tab_content(self, index=None):
+        """Return the content for a tab (default: the selected one), building it on the first visit"""
+        if index is None:
+            index = self.selected_tab_index
+        # Serializes builds, so a click during the background first build waits for it
+        # and reuses its result instead of building the same tab a second time
+        with self._tab_build_lock:
+            return self._build_tab_content(index)
+
+    def _build_tab_content(self, index):
+        if index in self._tab_content_cache:
+            return self._tab_content_cache[index]
         try:
-            if self.selected_tab_index == 1:  # Network Connections tab
-                layout, init_network = create_network_monitoring_layout(
-                    glass_bgcolor=self.glass_bgcolor,
-                    container_blur=self.container_blur,
-                    container_shadow=self.container_shadow
-                )
-                init_network(self.page)
-                return layout
-                
-            elif self.selected_tab_index == 4:  # Device Manager tab
-                # Use DeviceManagerUI from the external module
-                device_manager_ui = DeviceManagerUI(
-                    base_path=self.base_path,
-                    glass_bgcolor=self.glass_bgcolor,
-                    container_blur=self.container_blur,
-                    container_shadow=self.container_shadow,
-                    accent_color=self.accent_color,
-                    background_color=self.dark_bg,
-                    text_color=self.text_color
-                )
-                return device_manager_ui.build()  # Return the container directly
-
-            elif self.selected_tab_index == 3:  # Process Chains tab
-                layout, dashboard = create_process_chains_layout(
-                    glass_bgcolor=self.glass_bgcolor,
-                    container_blur=self.container_blur,
-                    container_shadow=self.container_shadow
-                )
-                start_proc_chain_updates(self.page, dashboard)
-                return layout
-                
-            elif self.selected_tab_index == 0:  # Process Monitor tab
-                layout, init_proc = create_process_monitoring_layout(
-                    glass_bgcolor=self.glass_bgcolor,
-                    container_blur=self.container_blur,
-                    container_shadow=self.container_shadow
-                )
-                init_proc(self.page)
-                return layout
-                
-            elif self.selected_tab_index == 2:  # Scheduled Processes tab
-                layout, dashboard = create_system_distribution_layout(
-                    glass_bgcolor=self.glass_bgcolor,
-                    container_blur=self.container_blur,
-                    container_shadow=self.container_shadow
-                )
-                start_realtime_updates(self.page, dashboard)
-                return layout  
-                
-            elif self.selected_tab_index == 5:  # System Logs tab
-                layout, init_logs = create_logs_analytics_layout(
-                    base_path=self.base_path,
-                    glass_bgcolor=self.glass_bgcolor,
-                    container_blur=self.container_blur,
-                    container_shadow=self.container_shadow,
-                    accent_color=self.accent_color,
-                    background_color=self.dark_bg,
-                    card_color=self.dark_card,
-                    text_color="#FFFFFF"
-                )
-                init_logs(self.page)
-                return layout
-                
-            else:
-                return ft.Container(
-                    content=ft.Text("Coming Soon...", size=20, color="white"),
-                    alignment=ft.alignment.center,
-                    expand=True
-                )
-                
+            build = self._tab_factories.get(index, self.build_coming_soon_tab)
+            content = build()
         except Exception as e:
             print(f"Error in get_tab_content: {e}")
+            # Not cached, so the tab is built again on the next visit
             return ft.Container(
                 expand=True,
                 bgcolor=self.dark_bg,
@@ -145,90 +315,108 @@ class DesktopApp:
                 alignment=ft.alignment.center
             )
 
-    # Create tab item 
+        self._tab_content_cache[index] = content
+        return content
+
+    def start_tab(self, index):
+        """Start a tab's background updates at most once per app lifetime"""
+        # The initial load thread and a click on the same tab may race to get here
+        with self._tab_start_lock:
+            if index in self._tab_started or index not in self._tab_starters:
+                return
+            self._tab_started.add(index)
+            starter = self._tab_starters.pop(index)
+        try:
+            starter()
+        except Exception as e:
+            print(f"Error starting tab {index}: {e}")
+
+    # Create tab item (always in the unselected style, see style_tab)
     def create_tab_item(self, icon_path, label, index):
+        # Kept so toggle_sidebar can restore the tooltip when collapsing
+        self._tab_tooltips[index] = ft.Tooltip(
+            message=label,
+            bgcolor="#08CDFF",
+            text_style=self._tooltip_text_style,
+            padding=10,
+        )
         return ft.Container(
             content=ft.Row([
-                ft.Container(
-                    content=ft.Image(
-                        src=icon_path,
-                        width=24,
-                        height=24,
-                        color="white" if index != self.selected_tab_index else self.accent_color,
-                        fit=ft.ImageFit.CONTAIN,
-                    ),
-                    tooltip=ft.Tooltip(
-                        message=label,
-                        bgcolor="#08CDFF",
-                        text_style=ft.TextStyle(color="white"),
-                        padding=10,
-                    ) if not self.sidebar_expanded else None,
-                    margin=ft.margin.only(left=0),
+                ft.Image(
+                    src=None if self.svg_base64.get(icon_path) else icon_path,
+                    src_base64=self.svg_base64.get(icon_path),
                     width=24,
                     height=24,
-                    alignment=ft.alignment.center,
+                    color=WHITE,
+                    fit=ft.ImageFit.CONTAIN,
+                    tooltip=self._tab_tooltips[index] if not self.sidebar_expanded else None,
                 ),
-                ft.Container(
-                    content=ft.Text(
-                        label,
-                        size=10,
-                        color="white" if index != self.selected_tab_index else self.accent_color,
-                        weight=ft.FontWeight.W_500,
-                        overflow=ft.TextOverflow.CLIP,
-                        max_lines=2,
-                    ),
+                ft.Text(
+                    label,
+                    size=10,
+                    color=WHITE,
+                    weight=ft.FontWeight.W_500,
+                    overflow=ft.TextOverflow.CLIP,
+                    max_lines=2,
                     visible=self.sidebar_expanded,
-                    padding=ft.padding.only(left=-5),
-                )
+                ),
             ],
             alignment=ft.MainAxisAlignment.START,
+            spacing=TAB_ICON_LABEL_SPACING,
             ),
-            bgcolor=self.glass_bgcolor if index == self.selected_tab_index else None,
-            blur=self.container_blur if index == self.selected_tab_index else None,
-            shadow=self.container_shadow if index == self.selected_tab_index else None,
+            key=f"tab-{index}",
             border_radius=0,
-            border=ft.border.all(1, self.accent_color) if index == self.selected_tab_index else None,
-            width=self.sidebar_expanded_width if self.sidebar_expanded else self.sidebar_width,
+            width=self._tab_width,
             height=50,
-            on_click=lambda e, idx=index: self.change_tab(e, idx),
-            animate=ft.animation.Animation(300, ft.AnimationCurve.EASE_OUT),
-            padding=ft.padding.symmetric(horizontal=10, vertical=5),
+            data=index,
+            on_click=self.change_tab,
+            animate=self.ease_animation,
+            padding=TAB_PADDING,
         )
 
     def toggle_sidebar(self, e):
         self.sidebar_expanded = not self.sidebar_expanded
-        self.sidebar_tabs.controls = [
-            self.create_tab_item(icon_path, label, i) 
-            for i, (icon_path, label) in enumerate(self.tabs_data)
-        ]
-        self.left_sidebar.width = self.sidebar_expanded_width if self.sidebar_expanded else self.sidebar_width
-        e.page.update()
-
-    def change_tab(self, e, index):
-        """Modified change_tab method to handle content switching"""
-        self.selected_tab_index = index
-        
-        # Update tab styling
+        width = self._tab_width = self.sidebar_expanded_width if self.sidebar_expanded else self.sidebar_width
+        # Patch the existing tab items in place instead of rebuilding them
         for i, tab in enumerate(self.sidebar_tabs.controls):
-            if i == index:
-                tab.bgcolor = self.glass_bgcolor
-                tab.blur = self.container_blur
-                tab.shadow = self.container_shadow
-                tab.content.controls[0].content.color = self.accent_color
-                if len(tab.content.controls) > 1:
-                    tab.content.controls[1].content.color = self.accent_color
-                tab.border = ft.border.all(1, self.accent_color)
-            else:
-                tab.bgcolor = None
-                tab.blur = None
-                tab.shadow = None
-                tab.content.controls[0].content.color = "white"
-                if len(tab.content.controls) > 1:
-                    tab.content.controls[1].content.color = "white"
-                tab.border = None
-        
-        # Update main content with a loading indicator
-        self.main_content_container.content = ft.Container(
+            icon, label = tab.content.controls
+            tab.width = width
+            label.visible = self.sidebar_expanded
+            icon.tooltip = None if self.sidebar_expanded else self._tab_tooltips[i]
+        self.left_sidebar.width = width
+        self.schedule_update(e.page)
+
+    def schedule_update(self, page):
+        """Queue a page.update(); requests within one frame (~16ms) share a single flush"""
+        with self._update_lock:
+            if self._update_pending:
+                return
+            self._update_pending = True
+        threading.Timer(0.016, self._flush_update, args=[page]).start()
+
+    def _flush_update(self, page):
+        with self._update_lock:
+            self._update_pending = False
+        page.update()
+
+    def style_tab(self, index, selected):
+        """Apply the selected or unselected style to one sidebar tab"""
+        tab = self.sidebar_tabs.controls[index]
+        color = self.accent_color if selected else WHITE
+        tab.bgcolor = self.glass_bgcolor if selected else None
+        tab.blur = self.container_blur if selected else None
+        tab.shadow = self.container_shadow if selected else None
+        tab.content.controls[0].color = color
+        tab.content.controls[1].color = color
+        tab.border = self._accent_border if selected else None
+
+    def change_tab(self, e):
+        """Sidebar click handler shared by every tab, the tab index is in data"""
+        self.set_tab(e.control.data)
+
+    def create_loading_indicator(self):
+        """Placeholder shown while a tab is being built"""
+        return ft.Container(
             content=ft.Column(
                 [ft.ProgressRing(), ft.Text("Loading...", color=self.text_color)],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
@@ -237,44 +425,79 @@ class DesktopApp:
             alignment=ft.alignment.center,
             expand=True
         )
-        e.page.update()
-        
-        # Get the new content for the selected tab after showing loading indicator
-        new_content = self.get_tab_content()
-        # Update the container's content
-        self.main_content_container.content = new_content
-        # Make sure to update the page to show the changes
-        e.page.update()
 
-    def main(self, page: ft.Page):
-        self.page = page
-        page.window_width = self.window_width
-        page.window_height = self.window_height
-        page.window_min_width = self.min_width
-        page.window_min_height = self.min_height
-        page.padding = 0
-        page.theme_mode = ft.ThemeMode.DARK
+    def load_initial_tab(self):
+        """Build the default tab after the first paint and swap it in"""
+        index = self.selected_tab_index
+        try:
+            content = self.get_tab_content(index)
+            # The user may have switched tabs while this one was being built
+            if self.selected_tab_index != index:
+                return
+            self.main_content_container.content = content
+            self.main_content_container.update()
+            self.start_tab(index)
+        except Exception as e:
+            print(f"Error loading initial tab {index}: {e}")
+
+    def set_tab(self, index):
+        """Show the given tab, updating only the sidebar tabs and the content area"""
+        # Clicking the tab that is already shown changes nothing (failed tabs may be retried)
+        if index == self.selected_tab_index and index in self._tab_content_cache:
+            return
+        self.selected_tab_index = index
         
-        # Create background image container
-        background = ft.Container(
-            expand=True,
-            content=ft.Image(
-                src=self.bg_image_path,
-                fit=ft.ImageFit.COVER,
-                repeat=ft.ImageRepeat.NO_REPEAT,
-            ),
+        # Update tab styling, only the previous and the new tab change
+        self.style_tab(self._prev_tab_index, False)
+        self.style_tab(index, True)
+        self._prev_tab_index = index
+        # Snapshot, the initial load thread may register a tab's event meanwhile
+        for tab_index, visible in list(self._tab_visible.items()):
+            if tab_index == index:
+                visible.set()
+            else:
+                visible.clear()
+        
+        if index not in self._tab_content_cache:
+            # Update main content with a loading indicator
+            self.main_content_container.content = self.create_loading_indicator()
+            self.page.update(self.sidebar_tabs, self.main_content_container)
+            
+        # Swap in the (cached) content for the selected tab after showing loading indicator
+        self.main_content_container.content = self.get_tab_content(index)
+        # Send only the changed subtrees instead of diffing the whole page
+        self.page.update(self.sidebar_tabs, self.main_content_container)
+        self.start_tab(index)
+
+    def create_background_image(self):
+        """Background decoration for the root container"""
+        return ft.DecorationImage(
+            src=None if self._bg_b64 else self.bg_image_path,
+            src_base64=self._bg_b64,
+            fit=ft.ImageFit.COVER,
+            repeat=ft.ImageRepeat.NO_REPEAT,
         )
 
-        
+    def on_resized(self, e):
+        """Re-rasterize the background only when the window size changes by more than 10%"""
+        if not self._bg_b64:
+            return
+        width, height = int(e.width), int(e.height)
+        old_width, old_height = self._bg_size
+        if abs(width - old_width) <= old_width * 0.1 and abs(height - old_height) <= old_height * 0.1:
+            return
+        bg_b64 = rasterize_image(self.bg_image_path, width, height)
+        if bg_b64:
+            self._bg_size = (width, height)
+            self._bg_b64 = bg_b64
+            self._background = self.create_background_image()
+            self.root_container.image = self._background
+            self.root_container.update()
+
+    def create_sidebar(self):
+        """Build the left sidebar once; tab state is applied through style_tab"""
         # Initialize tabs
-        self.tabs_data = [
-            (self.svg_icons["process_monitor"], "Process Monitor"),
-            (self.svg_icons["network"], "Network Connections"),
-            (self.svg_icons["scheduled"], "Scheduled Processes"),
-            (self.svg_icons["process_chains"], "Process Chains"),
-            (self.svg_icons["device_manager"], "Device Manager"),
-            (self.svg_icons["system_logs"], "System Logs"),
-        ]
+        self.tabs_data = [(self.svg_icons[name], label) for name, label in TABS]
 
         # Create sidebar tabs
         self.sidebar_tabs = ft.Column(
@@ -285,17 +508,18 @@ class DesktopApp:
             spacing=5,
             alignment=ft.MainAxisAlignment.START,
         )
+        self.style_tab(self.selected_tab_index, True)
 
         # Toggle button for sidebar
         toggle_button = ft.IconButton(
-            icon=Icons.MENU,
-            icon_color="white",
+            icon=self.ICON_MENU,
+            icon_color=WHITE,
             icon_size=20,
             on_click=self.toggle_sidebar,
         )
 
         # Left sidebar container
-        self.left_sidebar = ft.Container(
+        left_sidebar = ft.Container(
             content=ft.Column(
                 controls=[
                     ft.Container(
@@ -307,77 +531,80 @@ class DesktopApp:
                 ],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
             ),
-            width=self.sidebar_width,
+            width=self._tab_width,
             bgcolor=self.glass_bgcolor,
             blur=self.container_blur,
-            shadow=self.container_shadow,
+            shadow=self.container_shadow_fast,
             border_radius=ft.border_radius.only(top_right=15),
-            animate=ft.animation.Animation(300, ft.AnimationCurve.EASE_OUT),
+            animate=self.ease_animation,
         )
+        return left_sidebar
+
+    def create_logo(self):
+        """Logo image, decoded from memory and built only once"""
+        if self._logo_img is None:
+            self._logo_img = ft.Image(
+                src=None if self._logo_b64 else self.logo_path,
+                src_base64=self._logo_b64,
+                width=75,
+                height=65,
+                fit=ft.ImageFit.CONTAIN,
+            )
+        return self._logo_img
 
-        # Top bar with logo, search, notifications, and profile
-        top_bar = ft.Container(
+    def create_top_bar(self):
+        """Build the top bar with logo, search, notifications, and profile"""
+        return ft.Container(
             content=ft.Row(
                 controls=[
-                    ft.Image(
-                        src=os.path.join(self.base_path, "logo.png"),
-                        width=75,
-                        height=75,
-                        fit=ft.ImageFit.CONTAIN,
-                    ),
+                    self.create_logo(),
                     ft.Container(
                         content=ft.Row(
                             controls=[
-                                ft.Icon(Icons.SEARCH, color='#6c757d', size=20),
+                                self._search_icon,
                                 ft.TextField(
                                     border=ft.InputBorder.NONE,
                                     height=40,
                                     text_size=14,
                                     bgcolor='transparent',
-                                    color='white',
+                                    color=WHITE,
                                     hint_text="Search...",
-                                    hint_style=ft.TextStyle(color='#6c757d'),
+                                    hint_style=SEARCH_HINT_STYLE,
                                     expand=True,
-                                    content_padding=ft.padding.only(left=10, right=10),
+                                    content_padding=SEARCH_FIELD_PADDING,
                                 )
                             ],
                             spacing=10,
                         ),
                         bgcolor=self.glass_bgcolor,
-                        blur=self.container_blur,
                         border_radius=20,
-                        padding=ft.padding.only(left=15, right=15),
-                        expand=True,
+                        padding=SEARCH_BOX_PADDING,
+                        expand=1,
                     ),
-                    ft.Stack([
-                        ft.IconButton(
-                            icon=Icons.NOTIFICATIONS_OUTLINED,
-                            icon_color='white',
-                            icon_size=24,
-                            tooltip="Notifications",
-                        ),
-                    ]),
-                    ft.Row([
-                        ft.CircleAvatar(
-                            content=ft.Text("MP"),
-                            bgcolor="#00008B",
-                            radius=16,
-                        ),
-                        ft.Text("Mann Pandya", color="white", size=14),
-                        ft.Icon(Icons.ARROW_DROP_DOWN, color="white"),
-                    ], spacing=5),
+                    ft.IconButton(
+                        icon=self.ICON_NOTIFICATIONS,
+                        icon_color=WHITE,
+                        icon_size=24,
+                        tooltip="Notifications",
+                    ),
+                    self._profile_group,
                 ],
                 alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
                 spacing=15,
             ),
-            padding=ft.padding.only(left=5, right=20, top=0),
-            margin=ft.margin.only(top=-10)
+            padding=TOP_BAR_PADDING,
         )
 
-        # Create main content container that will be updated with tab changes
+    def create_root(self):
+        """Build the whole page tree once; later calls return the same root"""
+        if self.root_container is not None:
+            return self.root_container
+
+        # Create main content container that will be updated with tab changes,
+        # the default tab is filled in by load_initial_tab after the first paint
         self.main_content_container = ft.Container(
-            content=self.get_tab_content(),  # Get the initial content for the default tab
-            expand=True,
+            content=self.create_loading_indicator(),
+            expand=1,
         )
 
         # Assemble main layout
@@ -390,30 +617,36 @@ class DesktopApp:
             expand=True,
         )
 
-        content = ft.Container(
+        # Background image is painted by the root container itself, no extra layer
+        self.root_container = ft.Container(
             expand=True,
+            image=self._background,
             content=ft.Column(
                 controls=[
-                    top_bar,
+                    self._top_bar,
                     main_content,
                 ],
                 spacing=0,
                 expand=True,
             ),
         )
+        return self.root_container
 
-        # Final page assembly with background and content in a Stack
-        page.add(
-            ft.Stack(
-                controls=[
-                    background,
-                    content,
-                ],
-                expand=True,
-            )
-        )
+    def main(self, page: ft.Page):
+        self.page = page
+        page.window_width = self.window_width
+        page.window_height = self.window_height
+        page.window_min_width = self.min_width
+        page.window_min_height = self.min_height
+        page.padding = 0
+        page.theme_mode = ft.ThemeMode.DARK
         
-        page.update()
+        page.on_resized = self.on_resized
+
+        # Final page assembly
+        # page.add() already sends the update, no second page.update() needed
+        page.add(self.create_root())
+        threading.Thread(target=self.load_initial_tab, daemon=True).start()
 
 def main(page: ft.Page):
     app = DesktopApp()
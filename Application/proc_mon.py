@@ -13,7 +13,16 @@ logger = logging.getLogger(__name__)
 process_pattern = re.compile(r'(\w+|\d+)')
 process_cache = {}
 
-def create_process_monitoring_layout(glass_bgcolor, container_blur, container_shadow):
+# Style values shared by every table cell and search field
+tooltip_text_style = ft.TextStyle(color="white")
+hint_text_style = ft.TextStyle(color='#6c757d')
+search_field_padding = ft.padding.only(left=8, right=8)
+
+def create_process_monitoring_layout(glass_bgcolor, container_blur, container_shadow, visible_event=None):
+    # Background polling only runs while this event is set (i.e. the tab is on screen)
+    if visible_event is None:
+        visible_event = threading.Event()
+        visible_event.set()
     running_processes_table_ref = ft.Ref[ft.Container]()
     critical_alerts_table_ref = ft.Ref[ft.Container]()
     process_logs_table_ref = ft.Ref[ft.Container]()
@@ -22,6 +31,12 @@ def create_process_monitoring_layout(glass_bgcolor, container_blur, container_sh
     processes = {}
     process_logs = []
     critical_alerts = []
+    # Last data rendered into each table, used to skip rebuilding unchanged tables
+    table_snapshots = {}
+    # Minimum spacing between refreshes, also the page.update() throttle in update_process_data
+    refresh_interval = 0.5
+    # Active search text per table ref, re-applied after rows are patched
+    search_queries = {}
 
     def get_process_data():
         global process_cache
@@ -29,33 +44,41 @@ def create_process_monitoring_layout(glass_bgcolor, container_blur, container_sh
             current_processes = {}
             processes_data = psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status'])
             current_time = datetime.now()
+            current_stamp = current_time.strftime("%Y-%m-%d %H:%M:%S")
             current_pids = set()
+            # Loop-invariant lookups bound to locals once per refresh
+            add_pid = current_pids.add
+            get_cached = process_cache.get
+            add_log = process_logs.append
+            add_alert = critical_alerts.append
 
             for proc in processes_data:
-                pid = proc.info['pid']
+                info = proc.info
+                pid = info['pid']
                 if pid in (0, 1):
                     continue
-                current_pids.add(pid)
-                process_name = proc.info['name'] or "Unknown"
-                cpu_usage = proc.info['cpu_percent'] or 0.0
-                memory_usage = proc.info['memory_percent'] or 0.0
-                status = proc.info['status'] or "Running"
-
-                if pid in process_cache and process_cache[pid]['name'] == process_name and process_cache[pid]['status'] == status:
-                    current_processes[pid] = process_cache[pid]
-                    current_processes[pid]['cpu_usage'] = cpu_usage
-                    current_processes[pid]['memory_usage'] = memory_usage
+                add_pid(pid)
+                process_name = info['name'] or "Unknown"
+                cpu_usage = info['cpu_percent'] or 0.0
+                memory_usage = info['memory_percent'] or 0.0
+                status = info['status'] or "Running"
+
+                cached = get_cached(pid)
+                if cached is not None and cached['name'] == process_name and cached['status'] == status:
+                    cached['cpu_usage'] = cpu_usage
+                    cached['memory_usage'] = memory_usage
+                    current_processes[pid] = cached
                 else:
                     current_processes[pid] = {
                         'pid': pid, 'name': process_name, 'cpu_usage': cpu_usage, 'memory_usage': memory_usage,
                         'status': status, 'started_at': current_time, 'security_check': "Safe"
                     }
-                    if pid not in process_cache:
+                    if cached is None:
                         logger.info(f"New process detected: {process_name} (PID: {pid})")
                         # Include timestamp in process log
-                        process_logs.append([process_name, str(pid), f"{cpu_usage:.2f}%", f"{memory_usage:.2f}%", status, current_time.strftime("%Y-%m-%d %H:%M:%S")])
+                        add_log([process_name, str(pid), f"{cpu_usage:.2f}%", f"{memory_usage:.2f}%", status, current_stamp])
                         if cpu_usage > 80 or memory_usage > 80:
-                            critical_alerts.append([process_name, str(pid), f"High Usage: CPU {cpu_usage:.2f}%, Memory {memory_usage:.2f}%", current_time.strftime("%Y-%m-%d %H:%M:%S")])
+                            add_alert([process_name, str(pid), f"High Usage: CPU {cpu_usage:.2f}%, Memory {memory_usage:.2f}%", current_stamp])
 
             for pid in list(process_cache.keys()):
                 if pid not in current_pids:
@@ -76,106 +99,127 @@ def create_process_monitoring_layout(glass_bgcolor, container_blur, container_sh
             logger.error(f"Error fetching process data: {str(e)}")
             return [], [], f"Error: {str(e)}"
 
-    def update_process_data(page, last_update=[0], ui_update_interval=0.5):
+    def build_rows(data):
+        # Enum and constructor lookups hoisted out of the per-cell loop
+        DataRow, DataCell, Container, Text, Tooltip = ft.DataRow, ft.DataCell, ft.Container, ft.Text, ft.Tooltip
+        ellipsis = ft.TextOverflow.ELLIPSIS
+        rows = []
+        for row in data:
+            cells = []
+            for cell in row:
+                text = str(cell)
+                cells.append(DataCell(Container(
+                    content=Text(text, color="white", size=11, overflow=ellipsis),
+                    tooltip=Tooltip(message=text, bgcolor="#08CDFF", text_style=tooltip_text_style, padding=5)
+                )))
+            rows.append(DataRow(cells=cells))
+        return rows
+
+    def row_matches(row, search_text):
+        if not search_text:
+            return True
+        combined_text = " ".join(str(cell.content.content.value) for cell in row.cells).lower()
+        return search_text in combined_text
+
+    def patch_rows(table, data, search_text=""):
+        # Reuse the existing DataRows by position, only touching cells whose text changed
+        rows = table.rows
+        for row, values in zip(rows, data):
+            for cell, value in zip(row.cells, values):
+                text = str(value)
+                container = cell.content
+                if container.content.value != text:
+                    container.content.value = text
+                    container.tooltip.message = text
+        if len(data) > len(rows):
+            rows.extend(build_rows(data[len(rows):]))
+        else:
+            del rows[len(data):]
+        # Rows now hold new content, so decide visibility from the active search again
+        for row in rows:
+            row.visible = row_matches(row, search_text)
+
+    def update_process_data(page, last_update=[0], ui_update_interval=refresh_interval):
         running_data, alerts_data, status = get_process_data()
         current_time = time.time()
         
         if status_text_ref.current and status_text_ref.current.value != status:
             status_text_ref.current.value = status
         
-        if running_processes_table_ref.current and running_processes_table_ref.current.visible:
+        if running_processes_table_ref.current and running_processes_table_ref.current.visible and table_snapshots.get("running") != running_data:
             # Navigate through the nested structure to get to the DataTable
             table = running_processes_table_ref.current.content.controls[0].controls[0]
-            new_rows = [
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(
-                            ft.Container(
-                                content=ft.Text(
-                                    str(cell), 
-                                    color="white", 
-                                    size=11, 
-                                    overflow=ft.TextOverflow.ELLIPSIS
-                                ),
-                                tooltip=ft.Tooltip(
-                                    message=str(cell), 
-                                    bgcolor="#08CDFF", 
-                                    text_style=ft.TextStyle(color="white"), 
-                                    padding=5
-                                )
-                            )
-                        ) for cell in row
-                    ]
-                ) for row in running_data
-            ]
-            if table.rows != new_rows:
-                table.rows = new_rows
+            patch_rows(table, running_data, search_queries.get(running_processes_table_ref))
+            table_snapshots["running"] = list(running_data)
         
-        if critical_alerts_table_ref.current and critical_alerts_table_ref.current.visible:
+        if critical_alerts_table_ref.current and critical_alerts_table_ref.current.visible and table_snapshots.get("alerts") != alerts_data:
             # Navigate through the nested structure to get to the DataTable
             table = critical_alerts_table_ref.current.content.controls[0].controls[0]
-            new_rows = [
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(
-                            ft.Container(
-                                content=ft.Text(
-                                    str(cell), 
-                                    color="white", 
-                                    size=11, 
-                                    overflow=ft.TextOverflow.ELLIPSIS
-                                ),
-                                tooltip=ft.Tooltip(
-                                    message=str(cell), 
-                                    bgcolor="#08CDFF", 
-                                    text_style=ft.TextStyle(color="white"), 
-                                    padding=5
-                                )
-                            )
-                        ) for cell in row
-                    ]
-                ) for row in alerts_data
-            ]
-            if table.rows != new_rows:
-                table.rows = new_rows
+            patch_rows(table, alerts_data, search_queries.get(critical_alerts_table_ref))
+            table_snapshots["alerts"] = list(alerts_data)
         
-        if process_logs_table_ref.current:
+        if process_logs_table_ref.current and table_snapshots.get("logs") != process_logs:
             # Navigate through the nested structure to get to the DataTable
             table = process_logs_table_ref.current.content.controls[0].controls[0]
-            new_rows = [
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(
-                            ft.Container(
-                                content=ft.Text(
-                                    str(cell), 
-                                    color="white", 
-                                    size=11, 
-                                    overflow=ft.TextOverflow.ELLIPSIS
-                                ),
-                                tooltip=ft.Tooltip(
-                                    message=str(cell), 
-                                    bgcolor="#08CDFF", 
-                                    text_style=ft.TextStyle(color="white"), 
-                                    padding=5
-                                )
-                            )
-                        ) for cell in row
-                    ]
-                ) for row in process_logs
-            ]
-            if table.rows != new_rows:
-                table.rows = new_rows
+            patch_rows(table, process_logs, search_queries.get(process_logs_table_ref))
+            table_snapshots["logs"] = list(process_logs)
         
         if current_time - last_update[0] >= ui_update_interval:
             page.update()
             last_update[0] = current_time
 
+    # Debounce state for request_refresh, shared by the update loop, Refresh clicks and the timer
+    refresh_lock = threading.Lock()
+    last_refresh = 0.0
+    pending_refresh = None
+    refresh_running = False
+    refresh_requested = False
+
+    def request_refresh(page):
+        # Refreshes closer than refresh_interval collapse into one trailing run, and a
+        # request made while a scan is running only queues one run after it finishes
+        nonlocal pending_refresh, refresh_running, refresh_requested
+        with refresh_lock:
+            if refresh_running:
+                refresh_requested = True
+                return
+            if pending_refresh is not None:
+                pending_refresh.cancel()
+                pending_refresh = None
+            wait = refresh_interval - (time.time() - last_refresh)
+            if wait > 0:
+                pending_refresh = threading.Timer(wait, run_pending_refresh, args=[page])
+                pending_refresh.start()
+                return
+            refresh_running = True
+        run_refresh(page)
+
+    def run_refresh(page):
+        nonlocal last_refresh, refresh_running, refresh_requested
+        try:
+            update_process_data(page)
+        finally:
+            with refresh_lock:
+                refresh_running = False
+                # Spacing is measured from the end of a scan, so a slow scan never overlaps the next
+                last_refresh = time.time()
+                rerun = refresh_requested
+                refresh_requested = False
+            if rerun:
+                request_refresh(page)
+
+    def run_pending_refresh(page):
+        try:
+            request_refresh(page)
+        except Exception:
+            logger.exception("Error in debounced process refresh")
+
     def start_updates(page):
         def update_loop():
             while True:
+                visible_event.wait()
                 try:
-                    update_process_data(page)
+                    request_refresh(page)
                     time.sleep(10)
                 except Exception as e:
                     logger.error(f"Error in update loop: {str(e)}")
@@ -240,18 +284,18 @@ def create_process_monitoring_layout(glass_bgcolor, container_blur, container_sh
             if not search_text:
                 reset_table()
                 return
+            search_queries[table_ref] = search_text
             
             # Table structure is now container -> column -> row -> datatable
             if table_ref.current:
                 # Navigate to the DataTable through the nested structure
                 datatable = table_ref.current.content.controls[0].controls[0]
                 for row in datatable.rows:
-                    # Get text from each cell
-                    combined_text = " ".join(str(cell.content.content.value) for cell in row.cells).lower()
-                    row.visible = search_text in combined_text
+                    row.visible = row_matches(row, search_text)
                 datatable.update()
 
         def reset_table():
+            search_queries.pop(table_ref, None)
             # Table structure is now container -> column -> row -> datatable
             if table_ref.current:
                 # Navigate to the DataTable through the nested structure
@@ -270,8 +314,8 @@ def create_process_monitoring_layout(glass_bgcolor, container_blur, container_sh
 
         search_field = ft.TextField(
             border=ft.InputBorder.NONE, height=35, text_size=12, bgcolor='transparent', color='white',
-            hint_text=f"Search {title}...", hint_style=ft.TextStyle(color='#6c757d'), expand=True,
-            content_padding=ft.padding.only(left=8, right=8), on_change=filter_table
+            hint_text=f"Search {title}...", hint_style=hint_text_style, expand=True,
+            content_padding=search_field_padding, on_change=filter_table
         )
         filter_dropdown = ft.Dropdown(
             options=[ft.dropdown.Option(opt) for opt in ["Process Name", "PID", "CPU Usage", "Memory Usage", "Status", "Alert Description"]],
@@ -282,10 +326,10 @@ def create_process_monitoring_layout(glass_bgcolor, container_blur, container_sh
             content=ft.Row(
                 controls=[
                     ft.Container(content=ft.Row(controls=[ft.Icon(ft.Icons.SEARCH, color='#6c757d', size=16), search_field], spacing=5),
-                                 bgcolor=glass_bgcolor, blur=container_blur, border_radius=10, padding=ft.padding.only(left=10, right=10), expand=True),
-                    ft.Container(content=filter_dropdown, bgcolor=glass_bgcolor, blur=container_blur, border_radius=10, padding=5),
+                                 bgcolor=glass_bgcolor, border_radius=10, padding=ft.padding.only(left=10, right=10), expand=True),
+                    ft.Container(content=filter_dropdown, bgcolor=glass_bgcolor, border_radius=10, padding=5),
                     ft.Container(content=ft.PopupMenuButton(items=[ft.PopupMenuItem(text=opt) for opt in ["Newest First", "Oldest First", "CPU (High to Low)", "CPU (Low to High)"]], icon=ft.Icons.SORT, tooltip="Sort"),
-                                 bgcolor=glass_bgcolor, blur=container_blur, border_radius=10, padding=5)
+                                 bgcolor=glass_bgcolor, border_radius=10, padding=5)
                 ], spacing=8, alignment=ft.MainAxisAlignment.CENTER
             ),
             padding=10
@@ -314,7 +358,7 @@ def create_process_monitoring_layout(glass_bgcolor, container_blur, container_sh
             controls=[
                 ft.Container(content=create_search_filter_bar("Processes/Alerts", running_processes_table_ref if tabs.selected_index == 0 else critical_alerts_table_ref, "Processes/Alerts"), expand=1),
                 ft.Container(content=create_search_filter_bar("Process Logs", process_logs_table_ref, "Process Logs"), expand=1),
-                ft.IconButton(icon=ft.Icons.REFRESH, icon_color="white", tooltip="Refresh Now", on_click=lambda e: update_process_data(e.page))
+                ft.IconButton(icon=ft.Icons.REFRESH, icon_color="white", tooltip="Refresh Now", on_click=lambda e: request_refresh(e.page))
             ], spacing=4
         ),
         margin=ft.margin.only(left=10, right=10, top=2)
@@ -326,7 +370,6 @@ def create_process_monitoring_layout(glass_bgcolor, container_blur, container_sh
     def init_process_monitor(page: ft.Page):
         logger.info("Process monitor UI initialized")
         start_updates(page)
-        update_process_data(page)
 
     return layout, init_process_monitor
 
@@ -4,6 +4,7 @@ import threading
 from datetime import datetime
 import logging
 import sys
+import os
 
 # ----------------------------
 # Logging Configuration
@@ -37,6 +38,12 @@ LIGHT_GRAY = "#D9E2EC"
 ACCENT_COLOR = "#03DAC6"
 CARD_BG = "#112240"
 
+# Seconds between connection scans, override with IPMONITOR_POLL_INTERVAL
+POLL_INTERVAL = float(os.environ.get("IPMONITOR_POLL_INTERVAL", 2))
+
+# Process name per PID, so established connections don't re-open the process every poll
+process_name_cache = {}
+
 
 class FletLogHandler(logging.Handler):
     """
@@ -63,6 +70,8 @@ class IPMonitorTab:
     def __init__(self, page: ft.Page):
         self.page = page
         self.connections = {}
+        # Reused by the monitor loop instead of creating an Event every tick
+        self._poll_event = threading.Event()
 
         logger.info("Initializing IP Monitor Tab")
 
@@ -473,7 +482,9 @@ class IPMonitorTab:
     def _monitor_ip_connections(self):
         while True:
             try:
-                current_conns = self.get_foreign_connections()
+                # One counters snapshot per tick, shared by every connection
+                net_counters = psutil.net_io_counters()
+                current_conns = self.get_foreign_connections(net_counters)
                 logger.debug(f"Current foreign connections fetched: {len(current_conns)}")
 
                 # Check for new connections
@@ -488,7 +499,6 @@ class IPMonitorTab:
                     if ip not in current_conns and 'disconnected_at' not in self.connections[ip]:
                         logger.info(f"Connection disconnected: {ip}")
                         self.connections[ip]['disconnected_at'] = datetime.now()
-                        net_counters = psutil.net_io_counters()
                         self.connections[ip]['bytes_sent'] = (
                             net_counters.bytes_sent - self.connections[ip]['bytes_sent']
                         )
@@ -507,30 +517,49 @@ class IPMonitorTab:
                 logger.error(f"Error monitoring IP connections: {e}")
 
             self.page.update()
-            threading.Event().wait(2)
+            self._poll_event.wait(POLL_INTERVAL)
 
-    def get_foreign_connections(self):
+    def get_foreign_connections(self, net_counters=None):
         logger.debug("Fetching foreign connections using psutil")
+        if net_counters is None:
+            net_counters = psutil.net_io_counters()
+        connected_at = datetime.now()
         foreign_conns = {}
+        seen_pids = set()
         for conn in psutil.net_connections(kind='inet'):
             if conn.status == psutil.CONN_ESTABLISHED and conn.raddr:
                 ip = conn.raddr.ip
+                seen_pids.add(conn.pid)
                 # If multiple connections to same IP, we only track once
                 if ip not in foreign_conns:
-                    process = psutil.Process(conn.pid) if conn.pid else None
-                    process_name = process.name() if process else "Unknown"
+                    process_name = self.get_process_name(conn.pid)
                     process_id = conn.pid if conn.pid else "N/A"
                     foreign_conns[ip] = {
-                        'connected_at': datetime.now(),
-                        'bytes_sent': psutil.net_io_counters().bytes_sent,
-                        'bytes_recv': psutil.net_io_counters().bytes_recv,
+                        'connected_at': connected_at,
+                        'bytes_sent': net_counters.bytes_sent,
+                        'bytes_recv': net_counters.bytes_recv,
                         'process_name': process_name,
                         'process_id': process_id,
                         'security_check': self.perform_security_check(ip),
                     }
+        # Forget PIDs that no longer own a connection so the cache stays bounded
+        for pid in process_name_cache.keys() - seen_pids:
+            del process_name_cache[pid]
         logger.debug(f"Fetched {len(foreign_conns)} foreign connections")
         return foreign_conns
 
+    def get_process_name(self, pid):
+        if not pid:
+            return "Unknown"
+        name = process_name_cache.get(pid)
+        if name is None:
+            try:
+                name = psutil.Process(pid).name()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                return "Unknown"
+            process_name_cache[pid] = name
+        return name
+
     def perform_security_check(self, ip):
         malicious_ips = ["1.1.1.1", "2.2.2.2"]
         return "Malicious" if ip in malicious_ips else "Safe"